@@ -7,7 +7,9 @@ import contextlib
 import logging
 import sys
 import warnings
-from inspect import Parameter, signature
+import weakref
+from inspect import Parameter, Signature, isawaitable, signature
+from itertools import islice
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -15,7 +17,9 @@ from typing import (
     ClassVar,
     Coroutine,
     Dict,
+    FrozenSet,
     Iterable,
+    Iterator,
     List,
     Literal,
     Optional,
@@ -58,7 +62,7 @@ from .role import Role
 from .threads import Thread
 from .types.interactions import ApplicationCommandInteractionData
 from .user import User
-from .utils import MISSING, find, maybe_coroutine, parse_docstring
+from .utils import MISSING, parse_docstring
 
 if TYPE_CHECKING:
     from .abc import Snowflake
@@ -110,9 +114,25 @@ _log = logging.getLogger(__name__)
 _MAX_COMMAND_DESCRIPTION_LENGTH = 100
 # Description to use for slash commands when the user doesn't provide one.
 DEFAULT_SLASH_DESCRIPTION = "No description provided."
+# Exact types accepted for min_value and max_value. bool is an int subclass, so an isinstance check is unsuitable.
+_NUMERIC_OPTION_VALUE_TYPES = frozenset((int, float))
+# Option types that min_value and max_value can be set for.
+_NUMERIC_OPTION_TYPES = frozenset(
+    (ApplicationCommandOptionType.integer, ApplicationCommandOptionType.number)
+)
+# Raw option type values that mark an interaction option as a subcommand (group).
+_SUB_COMMAND_OPTION_TYPES = (
+    ApplicationCommandOptionType.sub_command.value,
+    ApplicationCommandOptionType.sub_command_group.value,
+)
+# Annotation origins that SlashCommandOption.get_type unpacks into their member types.
+_UNION_ANNOTATION_ORIGINS = frozenset((Union, Optional, Annotated, UnionType, None))
+# Annotation origins that unpack_annotation recurses into.
+_UNPACKABLE_ANNOTATION_ORIGINS = frozenset((Union, UnionType, Optional, Literal))
 
 T = TypeVar("T")
 FuncT = TypeVar("FuncT", bound=Callable[..., Any])
+AppCmdT = TypeVar("AppCmdT", bound="BaseApplicationCommand")
 # As nextcord.types exist, we cannot import types
 if TYPE_CHECKING:
     EllipsisType = ellipsis  # noqa: F821
@@ -125,6 +145,62 @@ def _cog_special_method(func: FuncT) -> FuncT:
     return func
 
 
+# Both are pure functions of the callback, so they are cached for as long as the callback is alive.
+_callback_signatures: weakref.WeakKeyDictionary[
+    Callable[..., Any], Signature
+] = weakref.WeakKeyDictionary()
+_callback_type_hints: weakref.WeakKeyDictionary[
+    Callable[..., Any], Dict[str, Any]
+] = weakref.WeakKeyDictionary()
+# Not stored as an attribute on the function, as functools.wraps would copy it onto a wrapper of a different kind.
+_coroutine_functions: weakref.WeakKeyDictionary[
+    Callable[..., Any], bool
+] = weakref.WeakKeyDictionary()
+
+
+def _get_callback_signature(callback: Callable[..., Any]) -> Signature:
+    """Returns the :class:`inspect.Signature` of the given callback, reusing a previously computed one if possible."""
+    with contextlib.suppress(KeyError, TypeError):
+        return _callback_signatures[callback]
+
+    sig = signature(callback)
+    # TypeError is raised if the callback cannot be weakly referenced.
+    with contextlib.suppress(TypeError):
+        _callback_signatures[callback] = sig
+
+    return sig
+
+
+def _is_coroutine_function(func: Callable[..., Any]) -> bool:
+    """Returns whether the given function is a coroutine function, reusing a previous result if possible."""
+    with contextlib.suppress(KeyError, TypeError):
+        return _coroutine_functions[func]
+
+    ret = asyncio.iscoroutinefunction(func)
+    # TypeError is raised if the function cannot be weakly referenced.
+    with contextlib.suppress(TypeError):
+        _coroutine_functions[func] = ret
+
+    return ret
+
+
+def _get_callback_type_hints(callback: Callable[..., Any]) -> Dict[str, Any]:
+    """Returns the resolved type hints of the given callback, reusing previously resolved ones if possible.
+
+    The returned dictionary is shared and should not be modified.
+    """
+    with contextlib.suppress(KeyError, TypeError):
+        return _callback_type_hints[callback]
+
+    # TODO: use typing.get_type_hints when 3.9 is standard
+    typehints = typing_extensions.get_type_hints(callback, include_extras=True)
+    # TypeError is raised if the callback cannot be weakly referenced.
+    with contextlib.suppress(TypeError):
+        _callback_type_hints[callback] = typehints
+
+    return typehints
+
+
 class CallbackWrapper:
     """A class used to wrap a callback in a sane way to modify aspects of application commands.
 
@@ -173,11 +249,13 @@ class CallbackWrapper:
         **kwargs,
     ) -> Union[CallbackWrapper, BaseApplicationCommand, SlashApplicationSubcommand]:
         wrapper = super(CallbackWrapper, cls).__new__(cls)
-        wrapper.__init__(callback, *args, **kwargs)
         if isinstance(callback, (BaseApplicationCommand, SlashApplicationSubcommand)):
+            # As the command is returned instead of the wrapper, Python won't call __init__ for us.
+            wrapper.__init__(callback, *args, **kwargs)
             callback.modify_callbacks.extend(wrapper.modify_callbacks)
             return callback
 
+        # Python calls __init__ on the returned wrapper, calling it here as well would initialize it twice.
         return wrapper
 
     def __init__(self, callback: Union[Callable, CallbackWrapper], *args, **kwargs) -> None:
@@ -195,6 +273,8 @@ class CallbackWrapper:
 
 
 class CallbackWrapperMixin:
+    __slots__ = ()
+
     def __init__(self, callback: Optional[Union[Callable, CallbackWrapper]]) -> None:
         """Adds very basic callback wrapper support.
 
@@ -205,11 +285,15 @@ class CallbackWrapperMixin:
         callback: Union[Callable, :class:`CallbackWrapper`]
             Callback or ``CallbackWrapper`` that the application command is wrapping.
         """
-        self.modify_callbacks: List[Callable] = []
-        if isinstance(callback, CallbackWrapper):
-            self.modify_callbacks += callback.modify_callbacks
+        self.modify_callbacks: List[Callable] = (
+            callback.modify_callbacks.copy() if isinstance(callback, CallbackWrapper) else []
+        )
 
     def modify(self) -> None:
+        # Most commands aren't wrapped by anything, and modify runs in every from_callback.
+        if not self.modify_callbacks:
+            return
+
         for modify_callback in self.modify_callbacks:
             modify_callback(self)
 
@@ -320,29 +404,24 @@ class ApplicationCommandOption:
             return []
 
         if isinstance(self.choices, dict):
-            choices = self.choices
+            choices = self.choices.items()
         else:
-            choices = {value: value for value in self.choices}
+            choices = ((value, value) for value in self.choices)
 
-        ret: List[Dict[str, Union[str, int, float, dict, None]]] = []
-        for display_name, value in choices.items():
-            # Discord returns the names as strings, might as well do it here so payload comparison is easy.
-            temp = {
-                "name": str(display_name),
+        choice_localizations = self.choice_localizations or {}
+        # Discord returns the names as strings, might as well do it here so payload comparison is easy.
+        return [
+            {
+                "name": name,
                 "value": value,
-            }
-            # The annotation prevents PyCharm from flipping the table and putting orange underlines under all of this.
-            if self.choice_localizations and (
-                locales := self.choice_localizations.get(str(display_name), None)
-            ):
-                temp["name_localizations"] = {
+                "name_localizations": {
                     str(locale): description for locale, description in locales.items()
                 }
-            else:
-                temp["name_localizations"] = None
-            ret.append(temp)
-
-        return ret
+                if (locales := choice_localizations.get(name, None))
+                else None,
+            }
+            for name, value in ((str(display_name), value) for display_name, value in choices)
+        ]
 
     @property
     def payload(self) -> dict:
@@ -350,6 +429,13 @@ class ApplicationCommandOption:
         if self.type is None:
             raise ValueError("The option type must be set before obtaining the payload.")
 
+        # When reading application commands from Discord, they return the channel types sorted.
+        # To prevent needless syncing and allow lazy loading, we need to sort them as well.
+        channel_types = (
+            sorted([channel_type.value for channel_type in self.channel_types])
+            if self.channel_types
+            else None
+        )
         # noinspection PyUnresolvedReferences
         ret: Dict[str, Any] = {
             "type": self.type.value,
@@ -358,33 +444,22 @@ class ApplicationCommandOption:
             "name_localizations": self.get_name_localization_payload(),
             "description_localizations": self.get_description_localization_payload(),
         }
+        # Optional keys are set directly instead of unpacking a temporary dict for each one.
         # We don't check if it's None because if it's False, we don't want to send it.
         if self.required:
             ret["required"] = self.required
-
         if self.choices:
             ret["choices"] = self.get_choices_localized_payload()
-
-        if self.channel_types:
-            # noinspection PyUnresolvedReferences
-            # When reading application commands from Discord, they return the channel types sorted.
-            # To prevent needless syncing and allow lazy loading, we need to sort them as well.
-            ret["channel_types"] = sorted(
-                [channel_type.value for channel_type in self.channel_types]
-            )
-
+        if channel_types:
+            ret["channel_types"] = channel_types
         if self.min_value is not None:
             ret["min_value"] = self.min_value
-
         if self.max_value is not None:
             ret["max_value"] = self.max_value
-
         if self.min_length is not None:
             ret["min_length"] = self.min_length
-
         if self.max_length is not None:
             ret["max_length"] = self.max_length
-
         if self.autocomplete:
             ret["autocomplete"] = self.autocomplete
 
@@ -431,6 +506,9 @@ class OptionConverter(_CustomTypingMetaBase):
     The ``modify`` method MAY be overridden to modify the :class:`BaseCommandOption`.
     """
 
+    # Subclasses without __slots__ of their own still get a __dict__ for any attributes they set.
+    __slots__ = ("type",)
+
     def __init__(self, option_type: Union[type, ApplicationCommandOptionType] = str) -> None:
         """Initializes the converter.
 
@@ -474,6 +552,8 @@ class OptionConverter(_CustomTypingMetaBase):
 class Mentionable(OptionConverter):
     """When a parameter is typehinted with this, it allows users to select both roles and members."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(ApplicationCommandOptionType.mentionable)
 
@@ -481,40 +561,121 @@ class Mentionable(OptionConverter):
         return value
 
 
+# Range and String create a new converter class per use, so results are only kept while the class is alive.
+_option_converter_classes: weakref.WeakKeyDictionary[type, bool] = weakref.WeakKeyDictionary()
+
+
+def _is_option_converter_class(annotation: Any) -> bool:
+    """Returns whether the given annotation is an uninstantiated :class:`OptionConverter` subclass."""
+    if not isinstance(annotation, type):
+        return False
+
+    with contextlib.suppress(KeyError):
+        return _option_converter_classes[annotation]
+
+    ret = _option_converter_classes[annotation] = issubclass(annotation, OptionConverter)
+    return ret
+
+
+def _get_option_converter(annotation: Any) -> Optional[OptionConverter]:
+    """Returns the :class:`OptionConverter` the given annotation represents, instantiating it if it's a class.
+
+    Returns ``None`` if the annotation isn't an option converter.
+    """
+    if isinstance(annotation, OptionConverter):
+        return annotation
+
+    if _is_option_converter_class(annotation):
+        return annotation()
+
+    return None
+
+
 class ClientCog:
     # TODO: I get it's a terrible name, I just don't want it to duplicate current Cog right now.
     __cog_application_commands__: List[BaseApplicationCommand]
+    __cog_application_command_members__: List[Tuple[BaseApplicationCommand, int]]
+    # Whether the class overrides each cog special method, filled in as they are looked up by _get_cog_hook.
+    __cog_application_command_hooks__: ClassVar[Dict[str, bool]] = {}
+
+    # Kinds of application command attributes found when scanning the cog class.
+    _SLASH_COMMAND: ClassVar[int] = 0
+    _SLASH_SUBCOMMAND: ClassVar[int] = 1
+    _APPLICATION_COMMAND: ClassVar[int] = 2
+    # Maps the type of class attributes to their kind, or None if they aren't an application command. Weakly keyed so
+    #  types of attributes of discarded cog classes aren't kept alive.
+    _application_command_kinds: ClassVar[
+        weakref.WeakKeyDictionary[type, Optional[int]]
+    ] = weakref.WeakKeyDictionary()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Each class gets its own, as a subclass may override methods that its parent doesn't.
+        cls.__cog_application_command_hooks__ = {}
 
     def __new__(cls, *_args: Any, **_kwargs: Any):
         new_cls = super(ClientCog, cls).__new__(cls)
         new_cls._read_application_commands()
         return new_cls
 
+    @classmethod
+    def _get_application_command_members(cls) -> List[Tuple[BaseApplicationCommand, int]]:
+        """Returns the application (sub)commands contained within the class paired with their kind.
+
+        The MRO is only walked once per class, the result is stored on the class itself so it is discarded along with
+        it.
+        """
+        # Look in the class __dict__ directly, as the members of a parent class are not the members of a subclass.
+        if (members := cls.__dict__.get("__cog_application_command_members__")) is not None:
+            return members
+
+        kinds = cls._application_command_kinds
+        members = []
+        for base in reversed(cls.__mro__):
+            for value in base.__dict__.values():
+                if isinstance(value, staticmethod):
+                    value = value.__func__
+
+                value_type = type(value)
+                try:
+                    kind = kinds[value_type]
+                except KeyError:
+                    kind = kinds[value_type] = cls._get_application_command_kind(value_type)
+
+                if kind is not None:
+                    members.append((value, kind))
+
+        cls.__cog_application_command_members__ = members
+        return members
+
+    @classmethod
+    def _get_application_command_kind(cls, value_type: type) -> Optional[int]:
+        if issubclass(value_type, SlashApplicationCommand):
+            return cls._SLASH_COMMAND
+        if issubclass(value_type, SlashApplicationSubcommand):
+            return cls._SLASH_SUBCOMMAND
+        if issubclass(value_type, BaseApplicationCommand):
+            return cls._APPLICATION_COMMAND
+        return None
+
     def _read_application_commands(self) -> None:
         """Iterates through the application (sub)commands contained within the ClientCog, runs their from_callback
         methods, then adds them to the internal list of application commands for this cog.
         """
         self.__cog_application_commands__ = []
-        for base in reversed(self.__class__.__mro__):
-            for value in base.__dict__.values():
-                is_static_method = isinstance(value, staticmethod)
-                if is_static_method:
-                    value = value.__func__
-
-                if isinstance(value, SlashApplicationCommand):
-                    value.parent_cog = self
-                    value.from_callback(value.callback, call_children=False)
-                    self.__cog_application_commands__.append(value)
-                elif isinstance(value, SlashApplicationSubcommand):
-                    # As subcommands are part of a parent command and
-                    #  not usable on their own, we don't add them to the command list, but do set the self_argument and
-                    #  run them from the callback.
-                    value.parent_cog = self
-                    value.from_callback(value.callback, call_children=False)
-                elif isinstance(value, BaseApplicationCommand):
-                    value.parent_cog = self
-                    value.from_callback(value.callback)
-                    self.__cog_application_commands__.append(value)
+        for value, kind in self._get_application_command_members():
+            value.parent_cog = self
+            if kind == self._SLASH_COMMAND:
+                value.from_callback(value.callback, call_children=False)
+                self.__cog_application_commands__.append(value)
+            elif kind == self._SLASH_SUBCOMMAND:
+                # As subcommands are part of a parent command and
+                #  not usable on their own, we don't add them to the command list, but do set the self_argument and
+                #  run them from the callback.
+                value.from_callback(value.callback, call_children=False)
+            else:
+                value.from_callback(value.callback)
+                self.__cog_application_commands__.append(value)
 
     def has_application_command_error_handler(self) -> bool:
         """:class:`bool`: Checks whether the cog has an error handler for application commands.
@@ -537,7 +698,7 @@ class ClientCog:
     @classmethod
     def _get_overridden_method(cls, method: FuncT) -> Optional[FuncT]:
         """Return None if the method is not overridden. Otherwise returns the overridden method."""
-        return getattr(method.__func__, "__cog_special_method__", method)
+        return getattr(getattr(method, "__func__", None), "__cog_special_method__", method)
 
     @_cog_special_method
     def cog_application_command_check(self, interaction: Interaction) -> bool:
@@ -599,6 +760,25 @@ class ClientCog:
         """
 
 
+def _get_cog_hook(cog: ClientCog, name: str) -> Optional[Callable]:
+    """Returns the given special method of the cog if it is overridden, otherwise ``None``.
+
+    Whether the class of the cog overrides the method is only looked up once per class, as it's needed on every
+    invocation of every command in the cog. A method assigned to the cog itself, for example in ``__init__``, takes
+    priority over the class.
+    """
+    if (hook := cog.__dict__.get(name)) is not None:
+        return ClientCog._get_overridden_method(hook)
+
+    overridden = type(cog).__cog_application_command_hooks__
+    if (is_overridden := overridden.get(name)) is None:
+        is_overridden = overridden[name] = (
+            ClientCog._get_overridden_method(getattr(cog, name, None)) is not None
+        )
+
+    return getattr(cog, name) if is_overridden else None
+
+
 class MissingApplicationCommandParametersWarning(UserWarning):
     """Warning category raised when creating a slash command from a callback when it appears
     the self and/or interaction parameter is missing based on the given type annotations.
@@ -615,7 +795,8 @@ class MissingApplicationCommandParametersWarning(UserWarning):
 
 
 class CallbackMixin:
-    name: Optional[str]
+    __slots__ = ()
+
     options: Dict[str, BaseCommandOption]
 
     def __init__(
@@ -636,11 +817,14 @@ class CallbackMixin:
         self._callback_before_invoke: Optional[ApplicationHook] = None
         self._callback_after_invoke: Optional[ApplicationHook] = None
         self.checks: List[ApplicationCheck] = []
+        # What the current options were created from, used to avoid recreating them in from_callback.
+        self._options_key: Optional[Tuple[Callable, Type[BaseCommandOption], bool]] = None
+        self._error_name_cache: Optional[Tuple[Optional[str], Optional[Callable], str]] = None
         if self.callback:
             if isinstance(callback, CallbackWrapper):
                 self.callback = callback.callback
 
-            if not asyncio.iscoroutinefunction(self.callback):
+            if not _is_coroutine_function(self.callback):
                 raise TypeError(f"{self.error_name} Callback must be a coroutine")
 
         self.parent_cog = parent_cog
@@ -677,7 +861,19 @@ class CallbackMixin:
         :class:`str`
             String containing the class name, command name, and callback object.
         """
-        return f"{self.__class__.__name__} {self.name} {self.callback}"
+        name = self.name
+        callback = self.callback
+        # Formatting the callback is relatively expensive, so reuse the string until the name or callback changes.
+        if (
+            (cached := self._error_name_cache) is not None
+            and cached[0] is name
+            and cached[1] is callback
+        ):
+            return cached[2]
+
+        error_name = f"{self.__class__.__name__} {name} {callback}"
+        self._error_name_cache = (name, callback, error_name)
+        return error_name
 
     @property
     def cog_before_invoke(self) -> Optional[ApplicationHook]:
@@ -692,9 +888,7 @@ class CallbackMixin:
         if not self.parent_cog:
             return None
 
-        return ClientCog._get_overridden_method(
-            self.parent_cog.cog_application_command_before_invoke
-        )
+        return _get_cog_hook(self.parent_cog, "cog_application_command_before_invoke")
 
     @property
     def cog_after_invoke(self) -> Optional[ApplicationHook]:
@@ -708,9 +902,7 @@ class CallbackMixin:
         if not self.parent_cog:
             return None
 
-        return ClientCog._get_overridden_method(
-            self.parent_cog.cog_application_command_after_invoke
-        )
+        return _get_cog_hook(self.parent_cog, "cog_application_command_after_invoke")
 
     def has_error_handler(self) -> bool:
         """:class:`bool`: Checks whether the command has an error handler registered."""
@@ -743,6 +935,17 @@ class CallbackMixin:
 
         return self
 
+    @property
+    def name(self) -> Optional[str]:
+        """Optional[:class:`str`]: The name of the command."""
+        return self._name
+
+    @name.setter
+    def name(self, value: Optional[str]) -> None:
+        # Might as well stringify the name, will come in handy if people try using numbers. Done here instead of when
+        #  making the payload, as the name is set far less often.
+        self._name = None if value is None else str(value)
+
     def from_callback(
         self,
         callback: Optional[Callable] = None,
@@ -780,23 +983,25 @@ class CallbackMixin:
             )
 
         try:
-            if not asyncio.iscoroutinefunction(self.callback):
+            if not _is_coroutine_function(self.callback):
                 raise TypeError("Callback must be a coroutine")
             # While this arguably is Slash Commands only, we could do some neat stuff in the future with it in other
             #  commands. While Discord doesn't support anything else having Options, we
             #  might be able to do something here.
-            if option_class:
-                skip_counter = 1
+            options_key = (self.callback, option_class, self.parent_cog is not None)
+            if option_class and options_key == self._options_key:
+                # The options were already created from this callback, only the cog they belong to may have changed.
+                for option in self.options.values():
+                    option.parent_cog = self.parent_cog
+            elif option_class:
                 # Getting the callback with `self_skip = inspect.ismethod(self.callback)` was problematic due to the
                 #  decorator going into effect before the class is instantiated, thus being a function at the time.
                 #  Try to look into fixing that in the future?
                 #  If self.parent_cog isn't reliable enough, we can possibly check if the first parameter name is `self`
-                if self.parent_cog:
-                    skip_counter += 1
+                skip_counter = 2 if self.parent_cog else 1
 
-                # TODO: use typing.get_type_hints when 3.9 is standard
-                typehints = typing_extensions.get_type_hints(self.callback, include_extras=True)
-                callback_params = dict(signature(self.callback).parameters)
+                typehints = _get_callback_type_hints(self.callback)
+                callback_params = dict(_get_callback_signature(self.callback).parameters)
 
                 for name, param in callback_params.copy().items():
                     if isinstance(param.annotation, str):
@@ -823,7 +1028,7 @@ class CallbackMixin:
                     or param.annotation is typing_extensions.Self
                     # will always be a self parameter
                     or isinstance(param.annotation, TypeVar)
-                    for param in list(callback_params.values())[:skip_counter]
+                    for param in islice(callback_params.values(), skip_counter)
                 )
 
                 if self.parent_cog is not None and non_option_params < 2:
@@ -839,17 +1044,19 @@ class CallbackMixin:
                         category=MissingApplicationCommandParametersWarning,
                     )
 
-                for param in callback_params.values():
-                    if skip_counter:
-                        skip_counter -= 1
-                    else:
-                        arg = option_class(param, self, parent_cog=self.parent_cog)  # type: ignore
+                new_options = {
+                    arg.name: arg
+                    for arg in (
                         # this is a mixin, so `self` would be odd here
+                        option_class(param, self, parent_cog=self.parent_cog)  # type: ignore
+                        for param in islice(callback_params.values(), skip_counter, None)
+                    )
+                }
+                if not all(new_options):
+                    raise ValueError("Cannot store an argument's type if the name is None")
 
-                        if not arg.name:
-                            raise ValueError("Cannot store an argument's type if the name is None")
-
-                        self.options[arg.name] = arg
+                self.options.update(new_options)
+                self._options_key = options_key
 
         except Exception as e:
             _log.error("Error creating from callback %s: %s", self.error_name, e)
@@ -877,43 +1084,49 @@ class CallbackMixin:
         :class:`bool`
             A boolean indicating if the command can be invoked.
         """
+        global_checks = interaction.client._application_command_checks
+        cog_check = (
+            _get_cog_hook(self.parent_cog, "cog_application_command_check")
+            if self.parent_cog
+            else None
+        )
+        # Most commands have no checks at all, skip straight to the result for them.
+        if not global_checks and cog_check is None and not self.checks:
+            return True
+
+        # Checks may be sync or async, they are awaited only if they return an awaitable. Any
+        #  ApplicationCheckFailure (or subclass) raised by a check propagates as is.
         # Global checks
-        for check in interaction.client._application_command_checks:
-            try:
-                check_result = await maybe_coroutine(check, interaction)
-            # To catch any subclasses of ApplicationCheckFailure.
-            except ApplicationCheckFailure:
-                raise
+        for check in global_checks:
+            check_result = check(interaction)
+            if isawaitable(check_result):
+                check_result = await check_result
             # If the check returns False, the command can't be run.
-            else:
-                if not check_result:
-                    raise ApplicationCheckFailure(
-                        f"The global check functions for application command {self.error_name} failed."
-                    )
+            if not check_result:
+                raise ApplicationCheckFailure(
+                    f"The global check functions for application command {self.error_name} failed."
+                )
 
         # Cog check
-        if self.parent_cog:
-            cog_check = ClientCog._get_overridden_method(
-                self.parent_cog.cog_application_command_check
-            )
-            if cog_check is not None and not await maybe_coroutine(cog_check, interaction):
+        if cog_check is not None:
+            check_result = cog_check(interaction)
+            if isawaitable(check_result):
+                check_result = await check_result
+            if not check_result:
                 raise ApplicationCheckFailure(
                     f"The cog check functions for application command {self.error_name} failed."
                 )
 
         # Command checks
         for check in self.checks:
-            try:
-                check_result = await maybe_coroutine(check, interaction)  # type: ignore
-            # To catch any subclasses of ApplicationCheckFailure.
-            except ApplicationCheckFailure:
-                raise
+            check_result = check(interaction)  # type: ignore
+            if isawaitable(check_result):
+                check_result = await check_result
             # If the check returns False, the command can't be run.
-            else:
-                if not check_result:
-                    raise ApplicationCheckFailure(
-                        f"The check functions for application command {self.error_name} failed."
-                    )
+            if not check_result:
+                raise ApplicationCheckFailure(
+                    f"The check functions for application command {self.error_name} failed."
+                )
 
         return True
 
@@ -942,14 +1155,21 @@ class CallbackMixin:
             return
 
         if can_run:
-            if self._callback_before_invoke is not None:
-                await self._callback_before_invoke(interaction)  # type: ignore
-
-            if (before_invoke := self.cog_before_invoke) is not None:
-                await before_invoke(interaction)  # type: ignore
+            client = interaction.client
+            parent_cog = self.parent_cog
+            # Each hook is read once, right before it runs, as earlier hooks or the callback may set or change them.
+            #  The cog hooks are read directly instead of through the cog_before_invoke/cog_after_invoke properties,
+            #  and skipped entirely for commands that aren't in a cog.
+            if (callback_before_invoke := self._callback_before_invoke) is not None:
+                await callback_before_invoke(interaction)  # type: ignore
+
+            if parent_cog is not None and (
+                cog_hook := _get_cog_hook(parent_cog, "cog_application_command_before_invoke")
+            ):
+                await cog_hook(interaction)  # type: ignore
 
-            if (before_invoke := interaction.client._application_command_before_invoke) is not None:
-                await before_invoke(interaction)
+            if (client_before_invoke := client._application_command_before_invoke) is not None:
+                await client_before_invoke(interaction)
 
             try:
                 await self(interaction, *args, **kwargs)
@@ -963,16 +1183,16 @@ class CallbackMixin:
             else:
                 state.dispatch("application_command_completion", interaction)
             finally:
-                if self._callback_after_invoke is not None:
-                    await self._callback_after_invoke(interaction)  # type: ignore
+                if (callback_after_invoke := self._callback_after_invoke) is not None:
+                    await callback_after_invoke(interaction)  # type: ignore
 
-                if (after_invoke := self.cog_after_invoke) is not None:
-                    await after_invoke(interaction)  # type: ignore
+                if parent_cog is not None and (
+                    cog_hook := _get_cog_hook(parent_cog, "cog_application_command_after_invoke")
+                ):
+                    await cog_hook(interaction)  # type: ignore
 
-                if (
-                    after_invoke := interaction.client._application_command_after_invoke
-                ) is not None:
-                    await after_invoke(interaction)
+                if (client_after_invoke := client._application_command_after_invoke) is not None:
+                    await client_after_invoke(interaction)
 
     async def invoke_callback(self, interaction: Interaction, *args, **kwargs) -> None:
         """|coro|
@@ -1001,7 +1221,7 @@ class CallbackMixin:
         callback: Callable[[:class:`Interaction`, :class:`ApplicationError`], :class:`asyncio.Awaitable[Any]`]
             The callback to call when an error occurs.
         """
-        if not asyncio.iscoroutinefunction(callback):
+        if not _is_coroutine_function(callback):
             raise TypeError("The error handler must be a coroutine.")
 
         self.error_callback = callback
@@ -1045,6 +1265,8 @@ class CallbackMixin:
 
 
 class AutocompleteOptionMixin:
+    name: Optional[str]
+
     def __init__(
         self,
         autocomplete_callback: Optional[Callable] = None,
@@ -1064,12 +1286,14 @@ class AutocompleteOptionMixin:
         """
         self.autocomplete_callback: Optional[Callable] = autocomplete_callback
         self.autocomplete_options: Set[str] = set()
+        # The autocomplete options minus this option, used as the kwargs for the autocomplete callback.
+        self._autocomplete_kwarg_names: FrozenSet[str] = frozenset()
         self.parent_cog: Optional[ClientCog] = parent_cog
 
     def from_autocomplete_callback(self, callback: Callable) -> AutocompleteOptionMixin:
         """Parses a callback meant to be the autocomplete function."""
         self.autocomplete_callback = callback
-        if not asyncio.iscoroutinefunction(self.autocomplete_callback):
+        if not _is_coroutine_function(self.autocomplete_callback):
             raise TypeError("Callback must be a coroutine")
 
         skip_count = 2  # We skip the first and second args, they are always the Interaction and
@@ -1078,11 +1302,10 @@ class AutocompleteOptionMixin:
             # If there's a parent cog, there should be a self. Skip it too.
             skip_count += 1
 
-        for name in signature(self.autocomplete_callback).parameters:
-            if skip_count:
-                skip_count -= 1
-            else:
-                self.autocomplete_options.add(name)
+        self.autocomplete_options = set(
+            islice(_get_callback_signature(self.autocomplete_callback).parameters, skip_count, None)
+        )
+        self._autocomplete_kwarg_names = frozenset(self.autocomplete_options - {self.name})
 
         return self
 
@@ -1104,6 +1327,8 @@ class AutocompleteOptionMixin:
 
 
 class AutocompleteCommandMixin:
+    __slots__ = ()
+
     options: Dict[str, SlashCommandOption]
     children: Dict[str, SlashApplicationSubcommand]
     _state: ConnectionState
@@ -1144,58 +1369,55 @@ class AutocompleteCommandMixin:
                 raise ValueError("Discord did not provide us interaction data")
 
             # pyright does not want to lose typeddict specificity but we do not care here
-            option_data = interaction.data.get("options", {})  # type: ignore
+            option_data = interaction.data.get("options") or []  # type: ignore
 
             if not option_data:
                 raise ValueError("Discord did not provide us option data")
 
         if self.children:
             await self.children[option_data[0]["name"]].call_autocomplete(
-                state, interaction, option_data[0].get("options", {})
+                state, interaction, option_data[0].get("options") or []
             )
         else:
-            focused_option_name = None
-            for arg in option_data:
-                if arg.get("focused", None) is True:
-                    if focused_option_name:
+            options = self.options
+            focused_arg_data = None
+            # Option data that was provided by the user, keyed by the functional name of the option.
+            provided_options: Dict[str, Tuple[SlashCommandOption, Dict[str, Any]]] = {}
+            for arg_data in option_data:
+                if arg_data.get("focused", None) is True:
+                    if focused_arg_data is not None:
                         raise ValueError(
                             "Multiple options are focused, is that supposed to be possible?"
                         )
 
-                    focused_option_name = arg["name"]
+                    focused_arg_data = arg_data
+
+                if option := options.get(arg_data["name"], None):
+                    provided_options[option.functional_name] = (option, arg_data)
 
-            if not focused_option_name:
+            if focused_arg_data is None:
                 raise ValueError("There's supposed to be a focused option, but it's not found?")
 
-            focused_option = self.options[focused_option_name]
+            focused_option = options[focused_arg_data["name"]]
             if focused_option.autocomplete_callback is None:
                 raise ValueError(
                     f"{self.error_name} Autocomplete called for option {focused_option.functional_name} but it doesn't "
                     f"have an autocomplete function?"
                 )
 
-            kwargs = {}
-            uncalled_options = focused_option.autocomplete_options.copy()
-
-            if focused_option.name is not None:
-                uncalled_options.discard(focused_option.name)
+            focused_option_value = await focused_option.handle_value(
+                state, focused_arg_data["value"], interaction
+            )
 
-            focused_option_value = None
-            for arg_data in option_data:
-                if (
-                    option := self.options.get(arg_data["name"], None)
-                ) and option.functional_name in uncalled_options:
-                    uncalled_options.discard(option.functional_name)
-                    kwargs[option.functional_name] = await option.handle_value(
-                        state, arg_data["value"], interaction
-                    )
-                elif arg_data["name"] == focused_option.name:
-                    focused_option_value = await focused_option.handle_value(
+            kwargs = {}
+            for option_name in focused_option._autocomplete_kwarg_names:
+                if provided := provided_options.get(option_name):
+                    option, arg_data = provided
+                    kwargs[option_name] = await option.handle_value(
                         state, arg_data["value"], interaction
                     )
-
-            for option_name in uncalled_options:
-                kwargs[option_name] = None
+                else:
+                    kwargs[option_name] = None
 
             value = await focused_option.invoke_autocomplete_callback(
                 interaction, focused_option_value, **kwargs
@@ -1387,28 +1609,39 @@ class SlashOption(ApplicationCommandOption, _CustomTypingMetaBase):
         return True
 
 
+# Default of SlashCommandOption.option_types, the same dict is shared so additions to either are seen by both.
+_OPTION_TYPES: Dict[type, ApplicationCommandOptionType] = {
+    str: ApplicationCommandOptionType.string,
+    int: ApplicationCommandOptionType.integer,
+    bool: ApplicationCommandOptionType.boolean,
+    User: ApplicationCommandOptionType.user,
+    Member: ApplicationCommandOptionType.user,
+    GuildChannel: ApplicationCommandOptionType.channel,
+    CategoryChannel: ApplicationCommandOptionType.channel,
+    DMChannel: ApplicationCommandOptionType.channel,
+    ForumChannel: ApplicationCommandOptionType.channel,
+    GroupChannel: ApplicationCommandOptionType.channel,
+    StageChannel: ApplicationCommandOptionType.channel,
+    TextChannel: ApplicationCommandOptionType.channel,
+    VoiceChannel: ApplicationCommandOptionType.channel,
+    Thread: ApplicationCommandOptionType.channel,
+    Role: ApplicationCommandOptionType.role,
+    Mentionable: ApplicationCommandOptionType.mentionable,
+    float: ApplicationCommandOptionType.number,
+    Attachment: ApplicationCommandOptionType.attachment,
+}
+# Optional[T] of every default type, so the common optional annotations don't need unpacking in get_type.
+_OPTIONAL_OPTION_TYPES: Dict[Any, ApplicationCommandOptionType] = {
+    Optional[annotation]: option_type for annotation, option_type in _OPTION_TYPES.items()
+}
+
+
 class SlashCommandOption(BaseCommandOption, SlashOption, AutocompleteOptionMixin):
     command: Union[SlashApplicationCommand, SlashApplicationSubcommand]
-    option_types: ClassVar[Dict[type, ApplicationCommandOptionType]] = {
-        str: ApplicationCommandOptionType.string,
-        int: ApplicationCommandOptionType.integer,
-        bool: ApplicationCommandOptionType.boolean,
-        User: ApplicationCommandOptionType.user,
-        Member: ApplicationCommandOptionType.user,
-        GuildChannel: ApplicationCommandOptionType.channel,
-        CategoryChannel: ApplicationCommandOptionType.channel,
-        DMChannel: ApplicationCommandOptionType.channel,
-        ForumChannel: ApplicationCommandOptionType.channel,
-        GroupChannel: ApplicationCommandOptionType.channel,
-        StageChannel: ApplicationCommandOptionType.channel,
-        TextChannel: ApplicationCommandOptionType.channel,
-        VoiceChannel: ApplicationCommandOptionType.channel,
-        Thread: ApplicationCommandOptionType.channel,
-        Role: ApplicationCommandOptionType.role,
-        Mentionable: ApplicationCommandOptionType.mentionable,
-        float: ApplicationCommandOptionType.number,
-        Attachment: ApplicationCommandOptionType.attachment,
-    }
+    _value_handlers: ClassVar[
+        Dict[ApplicationCommandOptionType, Callable[[ConnectionState, Any, Interaction], Any]]
+    ]
+    option_types: ClassVar[Dict[type, ApplicationCommandOptionType]] = _OPTION_TYPES
     """Maps Python annotations/typehints to Discord Application Command type values."""
 
     channel_mapping: ClassVar[Dict[type, Tuple[ChannelType, ...]]] = {
@@ -1430,6 +1663,9 @@ class SlashCommandOption(BaseCommandOption, SlashOption, AutocompleteOptionMixin
     }
     """Maps Python channel annotations/typehints to Discord ChannelType values."""
 
+    _default_slash_option: ClassVar[SlashOption] = SlashOption()
+    """Used in place of a :class:`SlashOption` when the parameter doesn't have one. Must not be modified."""
+
     def __init__(
         self,
         parameter: Parameter,
@@ -1437,9 +1673,12 @@ class SlashCommandOption(BaseCommandOption, SlashOption, AutocompleteOptionMixin
         parent_cog: Optional[ClientCog] = None,
     ) -> None:
         BaseCommandOption.__init__(self, parameter, command, parent_cog)
-        SlashOption.__init__(self)
-        # We subclassed SlashOption because we must handle all attributes it has.
+        # We subclassed SlashOption because we must handle all attributes it has. Every attribute is set further down,
+        #  so SlashOption.__init__ isn't ran, as it would only initialize the ApplicationCommandOption ones twice.
+        self._verify = True
         AutocompleteOptionMixin.__init__(self, parent_cog=parent_cog)
+        # Set from the command docstring by SlashCommandMixin.from_callback.
+        self._docstring_description: str = DEFAULT_SLASH_DESCRIPTION
 
         if isinstance(parameter.default, SlashOption):
             # Remember: Values that the user provided in SlashOption should override any logic.
@@ -1447,7 +1686,7 @@ class SlashCommandOption(BaseCommandOption, SlashOption, AutocompleteOptionMixin
             cmd_arg = parameter.default
             cmd_arg_given = True
         else:
-            cmd_arg = SlashOption()
+            cmd_arg = self._default_slash_option
             cmd_arg_given = False
 
         self.name = cmd_arg.name or parameter.name
@@ -1461,6 +1700,8 @@ class SlashCommandOption(BaseCommandOption, SlashOption, AutocompleteOptionMixin
         annotation_choices: List[Union[str, int, float]] = []
         annotation_channel_types: List[ChannelType] = []
         annotation_converters: List[OptionConverter] = []
+        # The resolve list for unpacking Annotated typehints, built once instead of per annotation.
+        resolvable_types = list(self.option_types)
 
         if typehint_origin is Literal:
             # If they use the Literal typehint as their base. This currently should only support int, float, str, and
@@ -1469,7 +1710,7 @@ class SlashCommandOption(BaseCommandOption, SlashOption, AutocompleteOptionMixin
             found_choices = []
             # for lit in typing.get_args(parameter.annotation):  # TODO: Once Python 3.10 is standard, use this.
             for lit in typing_extensions.get_args(parameter.annotation):
-                lit = unpack_annotated(lit, list(self.option_types.keys()))
+                lit = unpack_annotated(lit, resolvable_types)
                 lit_type = type(lit)
                 if lit is None:
                     # If None is included, they want it to be optional. But we don't want None added to the choices.
@@ -1498,7 +1739,7 @@ class SlashCommandOption(BaseCommandOption, SlashOption, AutocompleteOptionMixin
 
             annotation_type = found_type
             annotation_choices = found_choices
-        elif typehint_origin in (Union, Optional, Annotated, UnionType, None):
+        elif typehint_origin in _UNION_ANNOTATION_ORIGINS:
             # If the typehint base is Union, Optional, or not any grouping...
             found_type = MISSING
             found_channel_types: List[ChannelType] = []
@@ -1510,7 +1751,7 @@ class SlashCommandOption(BaseCommandOption, SlashOption, AutocompleteOptionMixin
                 literals: List[Annotated[OptionConverter, object]] = []
             else:
                 unpacked_annotations, literals = unpack_annotation(
-                    parameter.annotation, list(self.option_types.keys())
+                    parameter.annotation, resolvable_types
                 )
             # Make sure that all literals are only OptionConverters and nothing else.
             for lit in literals:
@@ -1531,15 +1772,10 @@ class SlashCommandOption(BaseCommandOption, SlashOption, AutocompleteOptionMixin
             grouped_annotations.extend(literals)
             # The only literals in this should be OptionConverters. Anything else should have triggered the ValueError.
             for anno in grouped_annotations:
-                if isinstance(anno, object) and isinstance(anno, OptionConverter):
-                    # If the annotation is instantiated, add it to the converters and set the anno to the type it has.
-                    annotation_converters.append(anno)
-                    anno = anno.type
-                elif isinstance(anno, type) and issubclass(anno, OptionConverter):
-                    # If the annotation is NOT instantiated, instantiate it and do the above.
-                    made_converter = anno()
-                    annotation_converters.append(made_converter)
-                    anno = made_converter.type
+                if (converter := _get_option_converter(anno)) is not None:
+                    # Add the (possibly just instantiated) converter, and set the anno to the type it has.
+                    annotation_converters.append(converter)
+                    anno = converter.type
 
                 if anno is None or anno is type(None):
                     # If None is included, they want it to be optional. But we don't want None processed fully as anno.
@@ -1622,14 +1858,9 @@ class SlashCommandOption(BaseCommandOption, SlashOption, AutocompleteOptionMixin
     @property
     def description(self) -> str:
         """:class:`str`: If no description is set, it returns "No description provided" """
-        # noinspection PyProtectedMember
         if self._description is not None:
             return self._description
-        if self.command._parsed_docstring and (
-            docstring := self.command._parsed_docstring["args"].get(self.functional_name)
-        ):
-            return docstring
-        return DEFAULT_SLASH_DESCRIPTION
+        return self._docstring_description
 
     @description.setter
     def description(self, value: str) -> None:
@@ -1647,23 +1878,27 @@ class SlashCommandOption(BaseCommandOption, SlashOption, AutocompleteOptionMixin
         elif isinstance(param_typing, ApplicationCommandOptionType):
             return param_typing
 
+        option_types = self.option_types
+        if valid_type := option_types.get(param_typing, None):
+            return valid_type
+
+        # Only valid while the defaults are in use, a subclass may map the same types differently.
+        if option_types is _OPTION_TYPES and (
+            valid_type := _OPTIONAL_OPTION_TYPES.get(param_typing)
+        ):
+            return valid_type
+
         # noinspection PyTypeChecker,PyUnboundLocalVariable
-        if param_typing is self.parameter.empty:
+        if param_typing is Parameter.empty:
             return ApplicationCommandOptionType.string
 
+        # Optional[T] resolves to the type of T.
+        # TODO: Once Python 3.10 is standard, use typing.get_args
+        anno_args = typing_extensions.get_args(param_typing)
         if (
-            # TODO: Once Python 3.10 is standard, use this
-            # type(None) in typing.get_args(param_typing)  # noqa: ERA001
-            (valid_type := self.option_types.get(param_typing, None))
-            or (
-                type(None) in typing_extensions.get_args(param_typing)
-                and (
-                    inner_type := find(
-                        lambda t: t is not type(None), typing_extensions.get_args(param_typing)
-                    )
-                )
-                and (valid_type := self.option_types.get(inner_type, None))
-            )
+            type(None) in anno_args
+            and (inner_type := next((t for t in anno_args if t is not type(None)), None))
+            and (valid_type := option_types.get(inner_type, None))
         ):
             return valid_type
 
@@ -1679,16 +1914,15 @@ class SlashCommandOption(BaseCommandOption, SlashOption, AutocompleteOptionMixin
                 "channel_types can only be given when the var is typed as nextcord.abc.GuildChannel"
             )
 
-        if self.min_value is not None and type(self.min_value) not in (int, float):
+        if self.min_value is not None and type(self.min_value) not in _NUMERIC_OPTION_VALUE_TYPES:
             raise ValueError("min_value must be an int or float.")
 
-        if self.max_value is not None and type(self.max_value) not in (int, float):
+        if self.max_value is not None and type(self.max_value) not in _NUMERIC_OPTION_VALUE_TYPES:
             raise ValueError("max_value must be an int or float.")
 
-        if (self.min_value is not None or self.max_value is not None) and self.type not in (
-            ApplicationCommandOptionType.integer,
-            ApplicationCommandOptionType.number,
-        ):
+        if (
+            self.min_value is not None or self.max_value is not None
+        ) and self.type not in _NUMERIC_OPTION_TYPES:
             raise ValueError(
                 "min_value or max_value can only be set if the type is integer or number."
             )
@@ -1719,66 +1953,87 @@ class SlashCommandOption(BaseCommandOption, SlashOption, AutocompleteOptionMixin
 
         return True
 
-    async def handle_value(
-        self, state: ConnectionState, value: Any, interaction: Interaction
+    @staticmethod
+    def _handle_channel_value(state: ConnectionState, value: Any, _interaction: Interaction) -> Any:
+        return state.get_channel(int(value))
+
+    @staticmethod
+    def _handle_user_value(state: ConnectionState, value: Any, interaction: Interaction) -> Any:
+        user_id = int(value)
+        if (user := _get_resolved_user(state, interaction, user_id)) is not None:
+            return user
+
+        # By here the interaction data doesn't contain
+        # a full member/user object yet so fall back to bot cache
+        value = None
+        data = cast(ApplicationCommandInteractionData, interaction.data)
+        if (guild_id := data.get("guild_id")) and (guild := state._guilds.get(int(guild_id))):
+            value = guild.get_member(user_id)
+
+        if value is None:
+            # Either we aren't in a guild or
+            # the member object is not cached
+            value = state._users.get(user_id)
+
+            if value is None:
+                # Fall back to a Object at-least
+                value = Object(id=user_id)
+
+        return value
+
+    @staticmethod
+    def _handle_role_value(_state: ConnectionState, value: Any, interaction: Interaction) -> Any:
+        if interaction.guild is None:
+            raise TypeError("Unable to handle a Role type when guild is None")
+
+        return interaction.guild.get_role(int(value))
+
+    @staticmethod
+    def _handle_integer_value(
+        _state: ConnectionState, value: Any, _interaction: Interaction
     ) -> Any:
-        if self.type is ApplicationCommandOptionType.channel:
-            value = state.get_channel(int(value))
-        elif self.type is ApplicationCommandOptionType.user:
-            user_id = int(value)
-            user_dict = {user.id: user for user in get_users_from_interaction(state, interaction)}
-            try:
-                value = user_dict[user_id]
-            except KeyError:
-                # By here the interaction data doesn't contain
-                # a full member/user object yet so fall back to bot cache
-                value = None
-                data = cast(ApplicationCommandInteractionData, interaction.data)
-                if (guild_id := data.get("guild_id")) and (
-                    guild := state._guilds.get(int(guild_id))
-                ):
-                    value = guild.get_member(user_id)
+        try:
+            return int(value)
+        except ValueError:
+            return None
 
-                if value is None:
-                    # Either we aren't in a guild or
-                    # the member object is not cached
-                    value = state._users.get(user_id)
+    @staticmethod
+    def _handle_number_value(_state: ConnectionState, value: Any, _interaction: Interaction) -> Any:
+        try:
+            return float(value)
+        except ValueError:
+            return None
 
-                    if value is None:
-                        # Fall back to a Object at-least
-                        value = Object(id=user_id)
-        elif self.type is ApplicationCommandOptionType.role:
-            if interaction.guild is None:
-                raise TypeError("Unable to handle a Role type when guild is None")
+    @staticmethod
+    def _handle_attachment_value(
+        state: ConnectionState, value: Any, interaction: Interaction
+    ) -> Any:
+        try:
+            # this looks messy but is too much effort to handle
+            # feel free to use typing.cast and if statements and raises
+            resolved_attachment_data = interaction.data["resolved"]["attachments"][value]  # type: ignore
+        except (AttributeError, ValueError, IndexError) as e:
+            raise ValueError(
+                "Discord did not provide us interaction data for the attachment"
+            ) from e
 
-            value = interaction.guild.get_role(int(value))
-        elif self.type is ApplicationCommandOptionType.integer:
-            try:
-                value = int(value)
-            except ValueError:
-                value = None
-        elif self.type is ApplicationCommandOptionType.number:
-            try:
-                value = float(value)
-            except ValueError:
-                value = None
-        elif self.type is ApplicationCommandOptionType.attachment:
-            try:
-                # this looks messy but is too much effort to handle
-                # feel free to use typing.cast and if statements and raises
-                resolved_attachment_data = interaction.data["resolved"]["attachments"][value]  # type: ignore
-            except (AttributeError, ValueError, IndexError) as e:
-                raise ValueError(
-                    "Discord did not provide us interaction data for the attachment"
-                ) from e
+        return Attachment(data=resolved_attachment_data, state=state)
 
-            value = Attachment(data=resolved_attachment_data, state=state)
-        elif self.type is ApplicationCommandOptionType.mentionable:
-            user_role_list: List[Union[User, Member, Role]] = get_users_from_interaction(
-                state, interaction
-            ) + get_roles_from_interaction(state, interaction)
-            mentionables = {mentionable.id: mentionable for mentionable in user_role_list}
-            value = mentionables[int(value)]
+    @staticmethod
+    def _handle_mentionable_value(
+        state: ConnectionState, value: Any, interaction: Interaction
+    ) -> Any:
+        mentionable_id = int(value)
+        if (user := _get_resolved_user(state, interaction, mentionable_id)) is not None:
+            return user
+
+        return _get_resolved_roles_by_id(state, interaction)[mentionable_id]
+
+    async def handle_value(
+        self, state: ConnectionState, value: Any, interaction: Interaction
+    ) -> Any:
+        if handler := self._value_handlers.get(self.type):
+            value = handler(state, value, interaction)
 
         if self.converters:
             ret = value
@@ -1789,7 +2044,22 @@ class SlashCommandOption(BaseCommandOption, SlashOption, AutocompleteOptionMixin
         return value
 
 
+# Maps an option type to the function converting the raw value Discord sent into a usable object. Types without
+#  an entry are passed through as-is.
+SlashCommandOption._value_handlers = {
+    ApplicationCommandOptionType.channel: SlashCommandOption._handle_channel_value,
+    ApplicationCommandOptionType.user: SlashCommandOption._handle_user_value,
+    ApplicationCommandOptionType.role: SlashCommandOption._handle_role_value,
+    ApplicationCommandOptionType.integer: SlashCommandOption._handle_integer_value,
+    ApplicationCommandOptionType.number: SlashCommandOption._handle_number_value,
+    ApplicationCommandOptionType.attachment: SlashCommandOption._handle_attachment_value,
+    ApplicationCommandOptionType.mentionable: SlashCommandOption._handle_mentionable_value,
+}
+
+
 class SlashCommandMixin(CallbackMixin):
+    __slots__ = ()
+
     if TYPE_CHECKING:
         _description: Optional[str]
         command_ids: Dict[Optional[int], int]
@@ -1800,6 +2070,7 @@ class SlashCommandMixin(CallbackMixin):
         CallbackMixin.__init__(self, callback=callback, parent_cog=parent_cog)
         self.options: Dict[str, SlashCommandOption] = {}
         self._parsed_docstring: Optional[Dict[str, Any]] = None
+        self._docstring_description: str = DEFAULT_SLASH_DESCRIPTION
         self._children: Dict[str, SlashApplicationSubcommand] = {}
 
     @property
@@ -1815,9 +2086,7 @@ class SlashCommandMixin(CallbackMixin):
     def description(self) -> str:
         if self._description is not None:
             return self._description
-        if self._parsed_docstring and (docstring := self._parsed_docstring["description"]):
-            return docstring
-        return DEFAULT_SLASH_DESCRIPTION
+        return self._docstring_description
 
     def from_callback(
         self,
@@ -1831,6 +2100,15 @@ class SlashCommandMixin(CallbackMixin):
             raise TypeError("Cannot parse docstring of a callback that is None")
 
         self._parsed_docstring = parse_docstring(callback, _MAX_COMMAND_DESCRIPTION_LENGTH)
+        # Resolve the docstring descriptions once, instead of every time a description is looked up.
+        self._docstring_description = (
+            self._parsed_docstring["description"] or DEFAULT_SLASH_DESCRIPTION
+        )
+        docstring_args = self._parsed_docstring["args"]
+        for option in self.options.values():
+            option._docstring_description = (
+                docstring_args.get(option.functional_name) or DEFAULT_SLASH_DESCRIPTION
+            )
 
     async def get_slash_kwargs(
         self,
@@ -1847,13 +2125,13 @@ class SlashCommandMixin(CallbackMixin):
                 raise ValueError("Discord did not provide us any options data")
 
         kwargs = {}
-        uncalled_args = self.options.copy()
+        options = self.options
+        get_option = options.get
         for arg_data in option_data:
-            if arg_data["name"] in uncalled_args:
-                uncalled_args.pop(arg_data["name"])
-                kwargs[self.options[arg_data["name"]].functional_name] = await self.options[
-                    arg_data["name"]
-                ].handle_value(state, arg_data.get("value"), interaction)
+            if (option := get_option(arg_data["name"])) is not None:
+                kwargs[option.functional_name] = await option.handle_value(
+                    state, arg_data.get("value"), interaction
+                )
             else:
                 # TODO: Handle this better.
                 raise ApplicationCommandOptionMissing(
@@ -1862,8 +2140,12 @@ class SlashCommandMixin(CallbackMixin):
                     f"Discord-sent args: {interaction.data['options']}, broke on {arg_data}"  # type: ignore
                 )
 
-        for uncalled_arg in uncalled_args.values():
-            kwargs[uncalled_arg.functional_name] = uncalled_arg.default
+        # Options that Discord didn't send get their default. It's read here instead of ahead of time, as
+        #  CallbackWrapper.modify or the user may change it after the command is created.
+        if len(kwargs) != len(options):
+            for option in options.values():
+                if option.functional_name not in kwargs:
+                    kwargs[option.functional_name] = option.default
 
         return kwargs
 
@@ -1940,6 +2222,35 @@ class BaseApplicationCommand(CallbackMixin, CallbackWrapperMixin):
         event.
     """
 
+    # __dict__ is kept so that subclasses and users can still set their own attributes.
+    __slots__ = (
+        "__dict__",
+        "__weakref__",
+        "modify_callbacks",
+        "callback",
+        "_callback_before_invoke",
+        "_callback_after_invoke",
+        "error_callback",
+        "checks",
+        "parent_cog",
+        "_options_key",
+        "_error_name_cache",
+        "_name",
+        "_state",
+        "type",
+        "_description",
+        "name_localizations",
+        "description_localizations",
+        "guild_ids_to_rollout",
+        "use_default_guild_ids",
+        "dm_permission",
+        "default_member_permissions",
+        "nsfw",
+        "force_global",
+        "command_ids",
+        "options",
+    )
+
     def __init__(
         self,
         name: Optional[str] = None,
@@ -2112,19 +2423,17 @@ class BaseApplicationCommand(CallbackMixin, CallbackWrapperMixin):
     @property
     def is_guild(self) -> bool:
         """:class:`bool`: Returns ``True`` if this command is or should be registered to any guilds."""
-        guild_only_ids = set(self.command_ids.keys())
-        guild_only_ids.discard(None)
-        return bool(self.guild_ids_to_rollout or guild_only_ids)
+        return bool(self.guild_ids_to_rollout) or any(
+            guild_id is not None for guild_id in self.command_ids
+        )
 
     @property
     def guild_ids(self) -> Set[int]:
         """Returns a :class:`set` containing all guild ID's this command is registered to."""
         # TODO: Is this worthwhile?
-        guild_only_ids = set(self.command_ids.keys())
-        guild_only_ids.discard(None)
-        # ignore explanation: Mypy says that guild_only_ids can contain None due to self.command_ids.keys() having
-        #  None being typehinted, but we remove None before returning it.
-        return guild_only_ids  # type: ignore
+        # ignore explanation: Mypy says that the set can contain None due to self.command_ids.keys() having
+        #  None being typehinted, but None is filtered out.
+        return {guild_id for guild_id in self.command_ids if guild_id is not None}  # type: ignore
 
     def add_guild_rollout(self, guild: Union[int, Guild]) -> None:
         """Adds a Guild to the command to be rolled out to when the rollout is run.
@@ -2169,12 +2478,12 @@ class BaseApplicationCommand(CallbackMixin, CallbackWrapperMixin):
         Set[Tuple[:class:`str`, :class:`int`, Optional[:class:`int`]]]
             A set of tuples that act as signatures.
         """
-        ret = set()
+        # The name and type are the same for every signature, only read them once.
+        # noinspection PyUnresolvedReferences
+        name, type_value = self.name, self.type.value
+        ret = {(name, type_value, guild_id) for guild_id in self.guild_ids_to_rollout}
         if self.is_global:
-            ret.add(self.get_signature(None))
-
-        for guild_id in self.guild_ids_to_rollout:
-            ret.add(self.get_signature(guild_id))
+            ret.add((name, type_value, None))
 
         return ret
 
@@ -2188,13 +2497,13 @@ class BaseApplicationCommand(CallbackMixin, CallbackWrapperMixin):
         Set[Tuple[:class:`str`, :class:`int`, Optional[:class:`int`]]]
             A set of tuples that act as signatures.
         """
-        ret = set()
+        # noinspection PyUnresolvedReferences
+        name, type_value = self.name, self.type.value
+        ret = {
+            (name, type_value, guild_id) for guild_id in self.command_ids if guild_id is not None
+        }
         if self.is_global:
-            ret.add(self.get_signature(None))
-
-        if self.is_guild:
-            for guild_id in self.guild_ids:
-                ret.add(self.get_signature(guild_id))
+            ret.add((name, type_value, None))
 
         return ret
 
@@ -2247,9 +2556,7 @@ class BaseApplicationCommand(CallbackMixin, CallbackWrapperMixin):
         # noinspection PyUnresolvedReferences
         ret = {
             "type": self.type.value,
-            "name": str(
-                self.name
-            ),  # Might as well stringify the name, will come in handy if people try using numbers.
+            "name": self.name,
             "description": str(self.description),  # Might as well do the same with the description.
             "name_localizations": self.get_name_localization_payload(),
             "description_localizations": self.get_description_localization_payload(),
@@ -2338,32 +2645,34 @@ class BaseApplicationCommand(CallbackMixin, CallbackWrapperMixin):
             _log.debug("Failed check dictionary values, not valid payload.")
             return False
 
-        if len(cmd_payload.get("options", [])) != len(raw_payload.get("options", [])):
+        cmd_options = cmd_payload.get("options", [])
+        raw_options = raw_payload.get("options", [])
+        if len(cmd_options) != len(raw_options):
             _log.debug("Option amount between commands not equal, not valid payload.")
             return False
 
-        for cmd_option in cmd_payload.get("options", []):
-            # I absolutely do not trust Discord or us ordering things nicely, so check through both.
-            found_correct_value = False
-            for raw_option in raw_payload.get("options", []):
-                if cmd_option["name"] == raw_option["name"]:
-                    found_correct_value = True
-                    # At this time, ApplicationCommand options are identical between locally-generated payloads and
-                    # payloads from Discord. If that were to change, switch from a recursive setup and manually
-                    # check_dictionary_values.
-                    if not deep_dictionary_check(cmd_option, raw_option):  # type: ignore
-                        # its a dict check so typeddicts do not matter
-                        _log.debug("Options failed deep dictionary checks, not valid payload.")
-                        return False
-
-                    break
-
-            if not found_correct_value:
+        # I absolutely do not trust Discord or us ordering things nicely, so match the options by name.
+        raw_options_by_name = {raw_option["name"]: raw_option for raw_option in raw_options}
+        for cmd_option in cmd_options:
+            if (raw_option := raw_options_by_name.get(cmd_option["name"])) is None:
                 _log.debug("Discord is missing an option we have, not valid payload.")
                 return False
 
+            # At this time, ApplicationCommand options are identical between locally-generated payloads and
+            # payloads from Discord. If that were to change, switch from a recursive setup and manually
+            # check_dictionary_values.
+            if not deep_dictionary_check(cmd_option, raw_option):  # type: ignore
+                # its a dict check so typeddicts do not matter
+                _log.debug("Options failed deep dictionary checks, not valid payload.")
+                return False
+
         return True
 
+    def _log_invalid_interaction(self, message: str, *args: Any) -> None:
+        # error_name includes the repr of the callback, so only build it if the message will actually be logged.
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("%s " + message, self.error_name, *args)
+
     def is_interaction_valid(self, interaction: Interaction) -> bool:
         """Checks if the interaction given is possibly valid for this command.
         If the command has more parameters (especially optionals) than the interaction coming in, this may cause a
@@ -2384,6 +2693,12 @@ class BaseApplicationCommand(CallbackMixin, CallbackWrapperMixin):
         if data is None:
             raise ValueError("Discord did not provide us with interaction data")
 
+        # Interactions for other commands are usually turned away by these, so check them before getting our payload.
+        #  The guild ID doesn't need checking, as our payload is made for the guild ID of the interaction.
+        if data.get("name") != self.name or data.get("type") != self.type.value:
+            self._log_invalid_interaction("Failed basic dictionary check.")
+            return False
+
         our_payload = self.get_payload(data.get("guild_id", None))
 
         def _recursive_subcommand_check(inter_pos: dict, cmd_pos: dict) -> bool:
@@ -2411,11 +2726,7 @@ class BaseApplicationCommand(CallbackMixin, CallbackWrapperMixin):
             if (
                 len(inter_options) == 1
                 and (  # If the length is only 1, it might be a subcommand (group).
-                    inter_options[0]["type"]
-                    in (
-                        ApplicationCommandOptionType.sub_command.value,
-                        ApplicationCommandOptionType.sub_command_group.value,
-                    )
+                    inter_options[0]["type"] in _SUB_COMMAND_OPTION_TYPES
                 )
                 and (  # This checks if it's a subcommand (group).
                     found_opt := our_options.get(
@@ -2446,69 +2757,43 @@ class BaseApplicationCommand(CallbackMixin, CallbackWrapperMixin):
                 ``True`` if the options match, ``False`` otherwise.
             """
             all_our_options = {}
-            required_options = {}
+            required_option_names = []
             for our_opt in cmd_options:
                 all_our_options[our_opt["name"]] = our_opt
                 if our_opt.get("required"):
-                    required_options[our_opt["name"]] = our_opt
+                    required_option_names.append(our_opt["name"])
 
             all_inter_options = {inter_opt["name"]: inter_opt for inter_opt in inter_options}
 
-            if len(all_our_options) >= len(all_inter_options):
-                # If we have more options (including options) than the interaction, we are good to proceed.
-                all_our_options_copy = all_our_options.copy()
-                all_inter_options_copy = all_inter_options.copy()
-                # Begin checking required options.
-                for our_opt_name, our_opt in required_options.items():
-                    if inter_opt := all_inter_options.get(our_opt_name):
-                        if (
-                            inter_opt["name"] == our_opt["name"]
-                            and inter_opt["type"] == our_opt["type"]
-                        ):
-                            all_our_options_copy.pop(our_opt_name)
-                            all_inter_options_copy.pop(our_opt_name)
-                        else:
-                            _log.debug(
-                                "%s Required option don't match name and/or type.", self.error_name
-                            )
-                            return False  # Options don't match name and/or type.
-
-                    else:
-                        _log.debug("%s Inter missing required option.", self.error_name)
-                        return False  # Required option wasn't found.
-                # Begin checking optional arguments.
-                for (
-                    inter_opt_name,
-                    inter_opt,
-                ) in all_inter_options_copy.items():  # Should only contain optionals now.
-                    if our_opt := all_our_options_copy.get(inter_opt_name):
-                        if not (
-                            inter_opt["name"] == our_opt["name"]
-                            and inter_opt["type"] == our_opt["type"]
-                        ):
-                            _log.debug(
-                                "%s Optional option don't match name and/or type.", self.error_name
-                            )
-                            return False  # Options don't match name and/or type.
-
-                    else:
-                        _log.debug("%s Inter has option that we don't.", self.error_name)
-                        return False  # They have an option name that we don't.
-
-            else:
-                _log.debug(
-                    "%s We have less options than them: %s vs %s",
-                    self.error_name,
+            if len(all_our_options) < len(all_inter_options):
+                self._log_invalid_interaction(
+                    "We have less options than them: %s vs %s",
                     all_our_options,
                     all_inter_options,
                 )
                 return False  # Interaction has more options than we do.
-            return True  # No checks failed.
 
-        # caring  about typeddict specificity will cause issues down the line
-        if not check_dictionary_values(our_payload, data, "name", "guild_id", "type"):  # type: ignore
-            _log.debug("%s Failed basic dictionary check.", self.error_name)
-            return False
+            # Begin checking required options.
+            for our_opt_name in required_option_names:
+                if not (inter_opt := all_inter_options.get(our_opt_name)):
+                    self._log_invalid_interaction("Inter missing required option.")
+                    return False  # Required option wasn't found.
+
+                if inter_opt["type"] != all_our_options[our_opt_name]["type"]:
+                    self._log_invalid_interaction("Required option don't match name and/or type.")
+                    return False  # Options don't match name and/or type.
+
+            # Every option they sent must be one of ours, and of the same type.
+            for inter_opt_name, inter_opt in all_inter_options.items():
+                if not (our_opt := all_our_options.get(inter_opt_name)):
+                    self._log_invalid_interaction("Inter has option that we don't.")
+                    return False  # They have an option name that we don't.
+
+                if inter_opt["type"] != our_opt["type"]:
+                    self._log_invalid_interaction("Optional option don't match name and/or type.")
+                    return False  # Options don't match name and/or type.
+
+            return True  # No checks failed.
 
         data_options = data.get("options")
         payload_options = our_payload.get("options")
@@ -2517,9 +2802,8 @@ class BaseApplicationCommand(CallbackMixin, CallbackWrapperMixin):
         if data_options is None and payload_options is None:
             return True  # User and Message commands don't have options.
 
-        _log.debug(
-            "%s Mismatch between data and payload options: %s vs %s",
-            self.error_name,
+        self._log_invalid_interaction(
+            "Mismatch between data and payload options: %s vs %s",
             data_options,
             payload_options,
         )
@@ -2563,6 +2847,34 @@ class BaseApplicationCommand(CallbackMixin, CallbackWrapperMixin):
 class SlashApplicationSubcommand(SlashCommandMixin, AutocompleteCommandMixin, CallbackWrapperMixin):
     """Class representing a subcommand or subcommand group of a slash command."""
 
+    # __dict__ is kept so that subclasses and users can still set their own attributes.
+    __slots__ = (
+        "__dict__",
+        "__weakref__",
+        "modify_callbacks",
+        "callback",
+        "_callback_before_invoke",
+        "_callback_after_invoke",
+        "error_callback",
+        "checks",
+        "parent_cog",
+        "_options_key",
+        "_error_name_cache",
+        "_qualified_name_cache",
+        "_name",
+        "_temp_autocomplete_callbacks",
+        "options",
+        "_parsed_docstring",
+        "_docstring_description",
+        "_children",
+        "parent_cmd",
+        "type",
+        "_description",
+        "name_localizations",
+        "description_localizations",
+        "_inherit_hooks",
+    )
+
     def __init__(
         self,
         name: Optional[str] = None,
@@ -2618,6 +2930,7 @@ class SlashApplicationSubcommand(SlashCommandMixin, AutocompleteCommandMixin, Ca
         self.type = cmd_type
         self.parent_cmd = parent_cmd
         self._inherit_hooks: bool = inherit_hooks
+        self._qualified_name_cache: Optional[Tuple[Optional[str], Optional[str], str]] = None
 
         self.options: Dict[str, SlashCommandOption] = {}
 
@@ -2629,9 +2942,19 @@ class SlashApplicationSubcommand(SlashCommandMixin, AutocompleteCommandMixin, Ca
 
         .. versionadded:: 2.1
         """
-        return (
-            f"{self.parent_cmd.qualified_name} {self.name}" if self.parent_cmd else str(self.name)
-        )
+        parent_name = self.parent_cmd.qualified_name if self.parent_cmd else None
+        name = self.name
+        # The parents return their cached string too, so identity checks tell if any name along the chain changed.
+        if (
+            (cached := self._qualified_name_cache) is not None
+            and cached[0] is parent_name
+            and cached[1] is name
+        ):
+            return cached[2]
+
+        qualified_name = f"{parent_name} {name}" if parent_name is not None else str(name)
+        self._qualified_name_cache = (parent_name, name, qualified_name)
+        return qualified_name
 
     async def call(
         self,
@@ -2689,9 +3012,7 @@ class SlashApplicationSubcommand(SlashCommandMixin, AutocompleteCommandMixin, Ca
         # noinspection PyUnresolvedReferences
         ret = {
             "type": self.type.value,
-            "name": str(
-                self.name
-            ),  # Might as well stringify the name, will come in handy if people try using numbers.
+            "name": self.name,
             "description": str(self.description),  # Might as well do the same with the description.
             "name_localizations": self.get_name_localization_payload(),
             "description_localizations": self.get_description_localization_payload(),
@@ -2800,6 +3121,13 @@ class SlashApplicationSubcommand(SlashCommandMixin, AutocompleteCommandMixin, Ca
 class SlashApplicationCommand(SlashCommandMixin, BaseApplicationCommand, AutocompleteCommandMixin):
     """Class representing a slash command."""
 
+    __slots__ = (
+        "_temp_autocomplete_callbacks",
+        "_parsed_docstring",
+        "_docstring_description",
+        "_children",
+    )
+
     def __init__(
         self,
         name: Optional[str] = None,
@@ -2894,14 +3222,15 @@ class SlashApplicationCommand(SlashCommandMixin, BaseApplicationCommand, Autocom
             raise ValueError("Discord did not provide us interaction data")
 
         # pyright does not want to lose typeddict specificity but we do not care here
-        option_data = interaction.data.get("options", [])
+        # An empty tuple is used as the default so that no throwaway list is made when options are present.
+        option_data = interaction.data.get("options", ())
 
         if self.children:
             if not option_data:
                 raise ValueError("Discord did not provide us any options data")
 
             await self.children[option_data[0]["name"]].call(
-                state, interaction, option_data[0].get("options", [])
+                state, interaction, option_data[0].get("options", ())
             )
         else:
             await self.call_slash(state, interaction, option_data)
@@ -2976,6 +3305,8 @@ class SlashApplicationCommand(SlashCommandMixin, BaseApplicationCommand, Autocom
 class UserApplicationCommand(BaseApplicationCommand):
     """Class representing a user context menu command."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         name: Optional[str] = None,
@@ -3042,9 +3373,10 @@ class UserApplicationCommand(BaseApplicationCommand):
         raise ValueError("UserApplicationCommands cannot have a description set.")
 
     async def call(self, state: ConnectionState, interaction: Interaction) -> None:
-        await self.invoke_callback_with_hooks(
-            state, interaction, args=(get_users_from_interaction(state, interaction)[0],)
-        )
+        if (user := next(_iter_users_from_interaction(state, interaction), None)) is None:
+            raise IndexError("Discord did not provide us a resolved user")
+
+        await self.invoke_callback_with_hooks(state, interaction, args=(user,))
 
     def from_callback(
         self,
@@ -3058,6 +3390,8 @@ class UserApplicationCommand(BaseApplicationCommand):
 class MessageApplicationCommand(BaseApplicationCommand):
     """Class representing a message context menu command."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         name: Optional[str] = None,
@@ -3124,9 +3458,10 @@ class MessageApplicationCommand(BaseApplicationCommand):
         raise ValueError("MessageApplicationCommands cannot have a description set.")
 
     async def call(self, state: ConnectionState, interaction: Interaction) -> None:
-        await self.invoke_callback_with_hooks(
-            state, interaction, args=(get_messages_from_interaction(state, interaction)[0],)
-        )
+        if (message := next(_iter_messages_from_interaction(state, interaction), None)) is None:
+            raise IndexError("Discord did not provide us a resolved message")
+
+        await self.invoke_callback_with_hooks(state, interaction, args=(message,))
 
     def from_callback(
         self,
@@ -3137,6 +3472,22 @@ class MessageApplicationCommand(BaseApplicationCommand):
         CallbackWrapperMixin.modify(self)
 
 
+def _application_command_decorator(
+    command_class: Type[AppCmdT], **kwargs: Any
+) -> Callable[[Callable], AppCmdT]:
+    """Returns a decorator that creates a ``command_class`` from the decorated function with the given kwargs.
+    Shared by :func:`slash_command`, :func:`message_command`, and :func:`user_command`.
+    """
+
+    def decorator(func: Callable) -> AppCmdT:
+        if isinstance(func, BaseApplicationCommand):
+            raise TypeError("Callback is already an application command.")
+
+        return command_class(callback=func, **kwargs)
+
+    return decorator
+
+
 def slash_command(
     name: Optional[str] = None,
     description: Optional[str] = None,
@@ -3189,24 +3540,18 @@ def slash_command(
         register to guilds. Has no effect if ``guild_ids`` are never set or added to.
     """
 
-    def decorator(func: Callable) -> SlashApplicationCommand:
-        if isinstance(func, BaseApplicationCommand):
-            raise TypeError("Callback is already an application command.")
-
-        return SlashApplicationCommand(
-            callback=func,
-            name=name,
-            name_localizations=name_localizations,
-            description=description,
-            description_localizations=description_localizations,
-            guild_ids=guild_ids,
-            dm_permission=dm_permission,
-            default_member_permissions=default_member_permissions,
-            nsfw=nsfw,
-            force_global=force_global,
-        )
-
-    return decorator
+    return _application_command_decorator(
+        SlashApplicationCommand,
+        name=name,
+        name_localizations=name_localizations,
+        description=description,
+        description_localizations=description_localizations,
+        guild_ids=guild_ids,
+        dm_permission=dm_permission,
+        default_member_permissions=default_member_permissions,
+        nsfw=nsfw,
+        force_global=force_global,
+    )
 
 
 def message_command(
@@ -3249,22 +3594,16 @@ def message_command(
         register to guilds. Has no effect if ``guild_ids`` are never set or added to.
     """
 
-    def decorator(func: Callable) -> MessageApplicationCommand:
-        if isinstance(func, BaseApplicationCommand):
-            raise TypeError("Callback is already an application command.")
-
-        return MessageApplicationCommand(
-            callback=func,
-            name=name,
-            name_localizations=name_localizations,
-            guild_ids=guild_ids,
-            dm_permission=dm_permission,
-            default_member_permissions=default_member_permissions,
-            nsfw=nsfw,
-            force_global=force_global,
-        )
-
-    return decorator
+    return _application_command_decorator(
+        MessageApplicationCommand,
+        name=name,
+        name_localizations=name_localizations,
+        guild_ids=guild_ids,
+        dm_permission=dm_permission,
+        default_member_permissions=default_member_permissions,
+        nsfw=nsfw,
+        force_global=force_global,
+    )
 
 
 def user_command(
@@ -3307,22 +3646,16 @@ def user_command(
         register to guilds. Has no effect if ``guild_ids`` are never set or added to.
     """
 
-    def decorator(func: Callable) -> UserApplicationCommand:
-        if isinstance(func, BaseApplicationCommand):
-            raise TypeError("Callback is already an application command.")
-
-        return UserApplicationCommand(
-            callback=func,
-            name=name,
-            name_localizations=name_localizations,
-            guild_ids=guild_ids,
-            dm_permission=dm_permission,
-            default_member_permissions=default_member_permissions,
-            nsfw=nsfw,
-            force_global=force_global,
-        )
-
-    return decorator
+    return _application_command_decorator(
+        UserApplicationCommand,
+        name=name,
+        name_localizations=name_localizations,
+        guild_ids=guild_ids,
+        dm_permission=dm_permission,
+        default_member_permissions=default_member_permissions,
+        nsfw=nsfw,
+        force_global=force_global,
+    )
 
 
 def check_dictionary_values(dict1: dict, dict2: dict, *keywords) -> bool:
@@ -3361,7 +3694,8 @@ def check_dictionary_values(dict1: dict, dict2: dict, *keywords) -> bool:
 
 def deep_dictionary_check(dict1: dict, dict2: dict) -> bool:
     """Used to check if all keys and values between two dicts are equal, and recurses if it encounters a nested dict."""
-    if dict1.keys() != dict2.keys():
+    # With equal lengths, every key of dict1 being in dict2 means the keys are equal, which is checked in the loop.
+    if len(dict1) != len(dict2):
         _log.debug(
             "Dict1 and Dict2 keys are not equal, not valid payload.\n %s vs %s",
             dict1.keys(),
@@ -3369,20 +3703,25 @@ def deep_dictionary_check(dict1: dict, dict2: dict) -> bool:
         )
         return False
 
-    for key in dict1:
-        if (
-            isinstance(dict1[key], dict)
-            and isinstance(dict2[key], dict)
-            and not deep_dictionary_check(dict1[key], dict2[key])
-        ):
+    for key, value1 in dict1.items():
+        if (value2 := dict2.get(key, MISSING)) is MISSING:
+            _log.debug(
+                "Dict1 and Dict2 keys are not equal, not valid payload.\n %s vs %s",
+                dict1.keys(),
+                dict2.keys(),
+            )
             return False
 
-        if dict1[key] != dict2[key]:
+        if isinstance(value1, dict) and isinstance(value2, dict):
+            # The recursive check already compares every nested value, don't compare the dicts again.
+            if not deep_dictionary_check(value1, value2):
+                return False
+        elif value1 != value2:
             _log.debug(
                 "Dict1 and Dict2 values are not equal, not valid payload.\n Key: %s, values %s vs %s",
                 key,
-                dict1[key],
-                dict2[key],
+                value1,
+                value2,
             )
             return False
 
@@ -3408,17 +3747,19 @@ def get_users_from_interaction(
     List[Union[:class:`User`, :class:`Member`]]
         List of resolved users, or members if possible
     """
-    data = interaction.data
-    ret: List[Union[User, Member]] = []
+    return list(_iter_users_from_interaction(state, interaction))
 
-    data = cast(ApplicationCommandInteractionData, data)
+
+def _iter_users_from_interaction(
+    state: ConnectionState, interaction: Interaction
+) -> Iterator[Union[User, Member]]:
+    # Lazy version of get_users_from_interaction, so callers needing only the first user don't construct the rest.
+    data = cast(ApplicationCommandInteractionData, interaction.data)
 
     # Return a Member object if the required data is available, otherwise fall back to User.
     if "resolved" in data and "members" in data["resolved"]:
         member_payloads = data["resolved"]["members"]
-        # Because the payload is modified further down, a copy is made to avoid affecting methods or
-        #  users that read from interaction.data further down the line.
-        for member_id, member_payload in member_payloads.copy().items():
+        for member_id, member_payload in member_payloads.items():
             if interaction.guild is None:
                 raise TypeError("Cannot resolve members if Interaction.guild is None")
 
@@ -3427,20 +3768,18 @@ def get_users_from_interaction(
                 not (member := interaction.guild.get_member(int(member_id)))
                 and "users" in data["resolved"]
             ):
-                user_payload = data["resolved"]["users"][member_id]
-                # This is required to construct the Member.
-                member_payload["user"] = user_payload
+                # The user is required to construct the Member. A new dict is made instead of adding it to the
+                #  payload to avoid affecting methods or users that read from interaction.data further down the line.
+                member_payload = {**member_payload, "user": data["resolved"]["users"][member_id]}
                 member = Member(data=member_payload, guild=interaction.guild, state=state)  # type: ignore
                 interaction.guild._add_member(member)
 
             if member is not None:
-                ret.append(member)
+                yield member
 
     elif "resolved" in data and "users" in data["resolved"]:
-        resolved_users_payload = data["resolved"]["users"]
-        ret = [state.store_user(user_payload) for user_payload in resolved_users_payload.values()]
-
-    return ret
+        for user_payload in data["resolved"]["users"].values():
+            yield state.store_user(user_payload)
 
 
 def get_messages_from_interaction(
@@ -3460,10 +3799,15 @@ def get_messages_from_interaction(
     List[:class:`Message`]
         A list of resolved messages.
     """
-    data = interaction.data
-    ret = []
+    return list(_iter_messages_from_interaction(state, interaction))
 
-    data = cast(ApplicationCommandInteractionData, data)
+
+def _iter_messages_from_interaction(
+    state: ConnectionState, interaction: Interaction
+) -> Iterator[Message]:
+    # Lazy version of get_messages_from_interaction, so callers needing only the first message don't construct the
+    #  rest.
+    data = cast(ApplicationCommandInteractionData, interaction.data)
 
     if "resolved" in data and "messages" in data["resolved"]:
         message_payloads = data["resolved"]["messages"]
@@ -3471,9 +3815,7 @@ def get_messages_from_interaction(
             if not (message := state._get_message(int(msg_id))):
                 message = Message(channel=interaction.channel, data=msg_payload, state=state)  # type: ignore  # interaction.channel can be VoiceChannel somehow
 
-            ret.append(message)
-
-    return ret
+            yield message
 
 
 def get_roles_from_interaction(state: ConnectionState, interaction: Interaction) -> List[Role]:
@@ -3514,6 +3856,46 @@ def get_roles_from_interaction(state: ConnectionState, interaction: Interaction)
     return ret
 
 
+def _get_resolved_user(
+    state: ConnectionState, interaction: Interaction, user_id: int
+) -> Optional[Union[User, Member]]:
+    # Resolves only the given user instead of every user in the resolved data, following the same rules as
+    #  _iter_users_from_interaction. Constructed members are added to the guild cache, so repeated lookups are cheap.
+    data = cast(ApplicationCommandInteractionData, interaction.data)
+    if "resolved" not in data:
+        return None
+
+    resolved = data["resolved"]
+    key = str(user_id)
+    if "members" in resolved:
+        if (member_payload := resolved["members"].get(key)) is None:
+            return None
+
+        if interaction.guild is None:
+            raise TypeError("Cannot resolve members if Interaction.guild is None")
+
+        if not (member := interaction.guild.get_member(user_id)) and "users" in resolved:
+            member_payload = {**member_payload, "user": resolved["users"][key]}
+            member = Member(data=member_payload, guild=interaction.guild, state=state)  # type: ignore
+            interaction.guild._add_member(member)
+
+        return member
+
+    if "users" in resolved and (user_payload := resolved["users"].get(key)) is not None:
+        return state.store_user(user_payload)
+
+    return None
+
+
+def _get_resolved_roles_by_id(state: ConnectionState, interaction: Interaction) -> Dict[int, Role]:
+    if (resolved := interaction._resolved_roles_by_id) is None:
+        resolved = interaction._resolved_roles_by_id = {
+            role.id: role for role in get_roles_from_interaction(state, interaction)
+        }
+
+    return resolved
+
+
 def unpack_annotated(given_annotation: Any, resolve_list: Optional[list[type]] = None) -> Any:
     """Takes an annotation. If the origin is Annotated, it will attempt to resolve it using the given list of accepted
     types, going from the last type and working up to the first. If no matches to the given list is found, the last
@@ -3545,7 +3927,7 @@ def unpack_annotated(given_annotation: Any, resolve_list: Optional[list[type]] =
         # arg_list = typing.get_args(given_annotation)  # noqa: ERA001
         arg_list = typing_extensions.get_args(given_annotation)
         for arg in reversed(arg_list[1:]):
-            if arg in resolve_list or isinstance(arg, type) and issubclass(arg, OptionConverter):
+            if arg in resolve_list or _is_option_converter_class(arg):
                 located_annotation = arg
                 break
 
@@ -3597,7 +3979,7 @@ def unpack_annotation(
         unpacked_type, unpacked_literal = unpack_annotation(located_annotation, annotated_list)
         type_ret.extend(unpacked_type)
         literal_ret.extend(unpacked_literal)
-    elif origin in (Union, UnionType, Optional, Literal):
+    elif origin in _UNPACKABLE_ANNOTATION_ORIGINS:
         # Note for someone refactoring this: UnionType (at this time) will be None on Python sub-3.10
         # This doesn't matter for now since None is explicitly checked first, but may trip you up when modifying this.
         # for anno in typing.get_args(given_annotation):  # TODO: Once Python 3.10 is standard, use this.
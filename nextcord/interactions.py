@@ -41,6 +41,7 @@ if TYPE_CHECKING:
     from .client import Client
     from .guild import Guild
     from .message import AllowedMentions
+    from .role import Role
     from .state import ConnectionState
     from .threads import Thread
     from .types.interactions import Interaction as InteractionPayload, InteractionData
@@ -172,6 +173,7 @@ class Interaction(Hashable, Generic[ClientT]):
         "_state",
         "_session",
         "_original_message",
+        "_resolved_roles_by_id",
         "_cs_response",
         "_cs_followup",
         "_cs_channel",
@@ -193,6 +195,8 @@ class Interaction(Hashable, Generic[ClientT]):
         self.id: int = int(data["id"])
         self.type: InteractionType = try_enum(InteractionType, data["type"])
         self.data: Optional[InteractionData] = data.get("data")
+        # Filled in lazily by application commands resolving role and mentionable options.
+        self._resolved_roles_by_id: Optional[Dict[int, Role]] = None
         self.token: str = data["token"]
         self.version: int = data["version"]
         self.channel_id: Optional[int] = utils.get_as_snowflake(data, "channel_id")
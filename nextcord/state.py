@@ -601,7 +601,9 @@ class ConnectionState:
             app_cmd
             for app_cmd in self.application_commands
             if guild_id is None
-            or guild_id in app_cmd.guild_ids
+            # guild_id isn't None here, so checking command_ids directly is the same as checking guild_ids, without
+            #  building a set of every guild the command is registered to.
+            or guild_id in app_cmd.command_ids
             or (rollout and guild_id in app_cmd.guild_ids_to_rollout)
         ]
 
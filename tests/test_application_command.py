@@ -0,0 +1,177 @@
+import asyncio
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from nextcord import Interaction, SlashOption
+from nextcord.application_command import (
+    ClientCog,
+    message_command,
+    slash_command,
+    user_command,
+)
+
+
+class FakeResponse:
+    def __init__(self) -> None:
+        self.autocomplete_choices = None
+
+    def is_done(self) -> bool:
+        return self.autocomplete_choices is not None
+
+    async def send_autocomplete(self, choices) -> None:
+        self.autocomplete_choices = choices
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self._application_command_checks = []
+        self._application_command_before_invoke = None
+        self._application_command_after_invoke = None
+
+
+class FakeState:
+    def __init__(self) -> None:
+        self.dispatched: List[str] = []
+
+    def dispatch(self, event: str, *_args: Any) -> None:
+        self.dispatched.append(event)
+
+
+class FakeInteraction:
+    def __init__(self, data: Dict[str, Any]) -> None:
+        self.data = data
+        self.client = FakeClient()
+        self.response = FakeResponse()
+        self.guild = None
+        self.application_command = None
+
+    def _set_application_command(self, command) -> None:
+        self.application_command = command
+
+
+def make_group():
+    @slash_command(description="Top level command.")
+    async def top(interaction: Interaction) -> None:
+        pass
+
+    @top.subcommand(description="A subcommand.")
+    async def sub(interaction: Interaction, word: str = SlashOption(choices={"A": "a"})) -> None:
+        pass
+
+    top.from_callback(top.callback)
+    return top, sub
+
+
+def test_payload_follows_subcommand_and_option_changes() -> None:
+    top, sub = make_group()
+    top.get_payload(None)
+
+    sub.name_localizations = {}
+    sub.name_localizations["de"] = "unter"
+    option = sub.options["word"]
+    option.name_localizations = {"de": "wort"}
+    option.name_localizations["fr"] = "mot"
+    option.choices["B"] = "b"
+    option.required = False
+
+    sub_payload = top.get_payload(None)["options"][0]
+    assert sub_payload["name_localizations"] == {"de": "unter"}
+    option_payload = sub_payload["options"][0]
+    assert option_payload["name_localizations"] == {"de": "wort", "fr": "mot"}
+    assert [choice["value"] for choice in option_payload["choices"]] == ["a", "b"]
+    assert "required" not in option_payload
+
+
+def test_guild_payloads_are_independent() -> None:
+    top, _ = make_group()
+    first = top.get_payload(123)
+    second = top.get_payload(456)
+    assert first["guild_id"] == 123
+    assert second["guild_id"] == 456
+
+    first["options"][0]["options"][0]["choices"].clear()
+    first["options"].clear()
+    assert second["options"][0]["options"][0]["choices"]
+    assert top.get_payload(None)["options"][0]["options"][0]["choices"]
+    assert "guild_id" not in top.get_payload(None)
+
+
+class HookCog(ClientCog):
+    def __init__(self, allow: bool) -> None:
+        self.allow = allow
+        self.events: List[str] = []
+        # Hooks set on the instance take priority over the (not overridden) ones of the class.
+        self.cog_application_command_check = self.check
+        self.cog_application_command_before_invoke = self.before
+        self.cog_application_command_after_invoke = self.after
+
+    def check(self, interaction: Interaction) -> bool:
+        self.events.append("check")
+        return self.allow
+
+    async def before(self, interaction: Interaction) -> None:
+        self.events.append("before")
+
+    async def after(self, interaction: Interaction) -> None:
+        self.events.append("after")
+
+    @slash_command(description="A command in a cog.")
+    async def command(self, interaction: Interaction) -> None:
+        self.events.append("callback")
+
+
+def test_cog_hooks_set_in_init() -> None:
+    cog = HookCog(allow=True)
+    command = cog.application_commands[0]
+    asyncio.run(command.call(FakeState(), FakeInteraction({"name": "command"})))  # type: ignore
+    assert cog.events == ["check", "before", "callback", "after"]
+
+    denied = HookCog(allow=False)
+    state = FakeState()
+    asyncio.run(command.call(state, FakeInteraction({"name": "command"})))  # type: ignore
+    # The command is shared by both cogs, and now belongs to the last one made.
+    assert denied.events == ["check"]
+    assert "application_command_error" in state.dispatched
+
+
+def test_autocomplete_with_renamed_option() -> None:
+    received: Dict[str, Optional[str]] = {}
+
+    @slash_command(description="Autocomplete.")
+    async def command(
+        interaction: Interaction,
+        first: str = SlashOption(name="first-option"),
+        second: str = SlashOption(name="second-option"),
+    ) -> None:
+        pass
+
+    @command.on_autocomplete("second")
+    async def second_autocomplete(interaction: Interaction, second: str, first: str) -> None:
+        received.update(first=first, second=second)
+        await interaction.response.send_autocomplete([second])
+
+    command.from_callback(command.callback)
+    interaction = FakeInteraction(
+        {
+            "name": "command",
+            "options": [
+                {"name": "first-option", "type": 3, "value": "one"},
+                {"name": "second-option", "type": 3, "value": "tw", "focused": True},
+            ],
+        }
+    )
+    asyncio.run(command.call_autocomplete(FakeState(), interaction))  # type: ignore
+    assert received == {"first": "one", "second": "tw"}
+    assert interaction.response.autocomplete_choices == ["tw"]
+
+
+@pytest.mark.parametrize("decorator", [user_command, message_command])
+def test_context_menu_command_without_resolved_data(decorator) -> None:
+    @decorator()
+    async def command(interaction: Interaction, target) -> None:
+        pass
+
+    command.from_callback(command.callback)
+    with pytest.raises(IndexError):
+        asyncio.run(command.call(FakeState(), FakeInteraction({"name": "command"})))  # type: ignore